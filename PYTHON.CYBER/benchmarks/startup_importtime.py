@@ -0,0 +1,79 @@
+"""
+Startup-time benchmark for the cyber_tools CLI
+
+Runs each command in a fresh interpreter with ``-X importtime`` and reports
+the median wall-clock time, the total time spent importing modules and
+whether Pillow/NumPy were loaded. Run from the PYTHON.CYBER directory:
+
+    python benchmarks/startup_importtime.py [--runs N]
+"""
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+import time
+
+HEAVY_MODULES = ("PIL", "numpy")
+
+COMMANDS = [
+    ("interpreter only", ["-c", "pass"], None),
+    ("--help", ["-m", "cyber_tools", "--help"], None),
+    ("caesar --help", ["-m", "cyber_tools", "caesar", "--help"], None),
+    ("image --help", ["-m", "cyber_tools", "image", "--help"], None),
+    ("image encrypt --help", ["-m", "cyber_tools", "image", "encrypt", "--help"], None),
+    ("password --help", ["-m", "cyber_tools", "password", "--help"], None),
+    ("caesar encrypt", ["-m", "cyber_tools", "caesar", "encrypt", "--shift", "3"], "Hello World\n"),
+    ("password", ["-m", "cyber_tools", "password"], "Tr0ub4dor&3\n"),
+]
+
+
+def parse_importtime(stderr):
+    """Return (total self time in us, set of imported module names)"""
+    total_us = 0
+    modules = set()
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        self_us, _cumulative, name = line[len("import time:"):].split("|", 2)
+        total_us += int(self_us)
+        modules.add(name.strip())
+    return total_us, modules
+
+
+def run_command(args, stdin, runs):
+    """Run one command repeatedly and collect its timings"""
+    wall_times = []
+    import_times = []
+    modules = set()
+    for _ in range(runs):
+        start = time.perf_counter()
+        completed = subprocess.run(
+            [sys.executable, "-X", "importtime", *args],
+            input=stdin, capture_output=True, text=True)
+        wall_times.append(time.perf_counter() - start)
+        import_us, modules = parse_importtime(completed.stderr)
+        import_times.append(import_us)
+    return statistics.median(wall_times), statistics.median(import_times), modules
+
+
+def main():
+    """Benchmark every command and print a summary table"""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--runs", type=int, default=10, help="runs per command (default: 10)")
+    args = parser.parse_args()
+
+    # Make the package importable regardless of the current directory
+    os.chdir(os.path.join(os.path.dirname(os.path.abspath(__file__)), os.pardir))
+
+    print(f"{'command':<22} {'wall [ms]':>10} {'imports [ms]':>13} {'modules':>8}  heavy")
+    print("-" * 66)
+    for name, command, stdin in COMMANDS:
+        wall, import_us, modules = run_command(command, stdin, args.runs)
+        heavy = [mod for mod in HEAVY_MODULES if mod in modules]
+        print(f"{name:<22} {wall * 1000:>10.1f} {import_us / 1000:>13.1f} "
+              f"{len(modules):>8}  {', '.join(heavy) or '-'}")
+
+
+if __name__ == "__main__":
+    main()
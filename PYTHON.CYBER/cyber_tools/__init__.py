@@ -0,0 +1,7 @@
+"""
+Cybersecurity educational tools: Caesar cipher, image encryption and
+password strength checking.
+
+Submodules are not imported here so that ``python -m cyber_tools`` only
+pays for the tool it actually runs (the image tool needs Pillow and NumPy).
+"""
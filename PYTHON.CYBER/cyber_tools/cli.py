@@ -0,0 +1,140 @@
+"""
+Non-interactive command line interface for all three tools
+
+Usage:
+    python -m cyber_tools caesar encrypt --shift 3 "Hello World"
+    python -m cyber_tools image encrypt photo.png --key 42
+    echo "MyP@ssw0rd" | python -m cyber_tools password
+
+Each tool module is imported inside its own subcommand handler, so heavy
+dependencies (Pillow and NumPy for the image tool) are only loaded when
+that subcommand actually runs, never for --help or the other tools.
+"""
+import argparse
+import sys
+
+
+def int_in_range(low, high):
+    """Return an argparse type that accepts integers between low and high"""
+    def parse(value):
+        try:
+            number = int(value)
+        except ValueError:
+            raise argparse.ArgumentTypeError(f"invalid integer: {value!r}")
+        if not low <= number <= high:
+            raise argparse.ArgumentTypeError(f"must be between {low} and {high}")
+        return number
+    return parse
+
+
+def read_inputs(values):
+    """Use command line values if given, otherwise read lines from stdin"""
+    if values:
+        return values
+    return [line.rstrip("\r\n") for line in sys.stdin]
+
+
+def run_caesar(args):
+    """Encrypt or decrypt each message with the Caesar cipher"""
+    from .caesar_cipher import caesar_encrypt, caesar_decrypt
+
+    transform = caesar_encrypt if args.action == "encrypt" else caesar_decrypt
+    for message in read_inputs(args.text):
+        print(transform(message, args.shift))
+    return 0
+
+
+def run_image(args):
+    """Apply the selected pixel manipulation to an image"""
+    try:
+        from . import pixel_manipulation
+    except ImportError as e:
+        print(f"Error: the image tool requires Pillow and NumPy ({e})", file=sys.stderr)
+        print("Install them with: pip install pillow numpy", file=sys.stderr)
+        return 1
+
+    if args.action == "encrypt":
+        output_path = pixel_manipulation.encrypt_image(args.image, args.key, args.output)
+    elif args.action == "decrypt":
+        output_path = pixel_manipulation.decrypt_image(args.image, args.key, args.output)
+    elif args.action == "swap":
+        output_path = pixel_manipulation.swap_pixels(args.image, args.output)
+    elif args.action == "unswap":
+        output_path = pixel_manipulation.unswap_pixels(args.image, args.output)
+    else:
+        output_path = pixel_manipulation.mathematical_encryption(
+            args.image, args.operation, args.value, args.output)
+    return 0 if output_path else 1
+
+
+def run_password(args):
+    """Assess the strength of each password"""
+    from .password_checker import PasswordChecker, display_results
+
+    checker = PasswordChecker()
+    for password in read_inputs(args.password):
+        result = checker.assess_password(password)
+        if 'max_score' not in result:
+            # Empty password: assess_password only returns a reason
+            print(f"{result['strength']}: {result['feedback'][0]}")
+        elif args.details:
+            display_results(result)
+        else:
+            print(f"{result['strength']} (Score: {result['score']}/{result['max_score']})")
+    return 0
+
+
+def build_parser():
+    """Build the argument parser for all subcommands"""
+    parser = argparse.ArgumentParser(
+        prog="cyber_tools",
+        description="Caesar cipher, image encryption and password checking tools")
+    tools = parser.add_subparsers(dest="tool", metavar="TOOL", required=True)
+
+    caesar = tools.add_parser("caesar", help="Encrypt or decrypt text with a Caesar cipher")
+    actions = caesar.add_subparsers(dest="action", metavar="ACTION", required=True)
+    for name, description in [("encrypt", "Encrypt messages"), ("decrypt", "Decrypt messages")]:
+        action = actions.add_parser(name, help=description)
+        action.add_argument("--shift", type=int_in_range(0, 25), required=True,
+                            help="shift value (0-25)")
+        action.add_argument("text", nargs="*",
+                            help="messages to process (default: one per line from stdin)")
+    caesar.set_defaults(handler=run_caesar)
+
+    image = tools.add_parser("image", help="Encrypt or decrypt an image by pixel manipulation")
+    actions = image.add_subparsers(dest="action", metavar="ACTION", required=True)
+
+    image_parsers = []
+    for name, description in [("encrypt", "XOR encrypt an image"),
+                              ("decrypt", "XOR decrypt an image")]:
+        action = actions.add_parser(name, help=description)
+        action.add_argument("--key", type=int_in_range(1, 255), required=True,
+                            help="encryption key (1-255)")
+        image_parsers.append(action)
+    image_parsers.append(actions.add_parser("swap", help="Apply pixel swapping"))
+    image_parsers.append(actions.add_parser("unswap", help="Reverse pixel swapping"))
+    math = actions.add_parser("math", help="Apply a mathematical operation to pixel values")
+    math.add_argument("--operation", required=True,
+                      choices=["add", "subtract", "multiply", "divide"])
+    math.add_argument("--value", type=float, required=True)
+    image_parsers.append(math)
+
+    for action in image_parsers:
+        action.add_argument("image", help="path of the image to process")
+        action.add_argument("-o", "--output", help="output path (default: derived from input)")
+    image.set_defaults(handler=run_image)
+
+    password = tools.add_parser("password", help="Assess password strength")
+    password.add_argument("password", nargs="*",
+                          help="passwords to check (default: one per line from stdin)")
+    password.add_argument("--details", action="store_true",
+                          help="show the full assessment report")
+    password.set_defaults(handler=run_password)
+
+    return parser
+
+
+def main(argv=None):
+    """Parse arguments and run the selected tool, returning an exit code"""
+    args = build_parser().parse_args(argv)
+    return args.handler(args)